@@ -0,0 +1,110 @@
+"""Tests for the example Python client.
+
+These cover the async client's retry behavior around file-backed
+uploads, where aiohttp closes the payload it was handed after each
+send. They skip when the client's dependencies aren't installed.
+
+Run with:
+    pytest examples/test_receipt_extractor_client.py
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from receipt_extractor_client import AsyncReceiptExtractorClient, _RetrySafeFile
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, status, body=b'{"merchant_name": "A"}'):
+        self.status = status
+        self.headers = {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class ClosingSession:
+    """Fake session that closes the payload after each send, like aiohttp."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.bodies = []
+
+    def post(self, url, data=None, headers=None):
+        self.bodies.append(data)
+        if hasattr(data, '_fields'):
+            # FormData: close the field values, like aiohttp's multipart
+            # payload does on teardown
+            for _, _, value in data._fields:
+                if hasattr(value, 'close'):
+                    value.close()
+        elif hasattr(data, 'close'):
+            data.close()
+        return FakeResponse(self.statuses.pop(0))
+
+
+def _make_client():
+    # Zero back-off so retry tests don't sleep
+    return AsyncReceiptExtractorClient("http://api.test", "test-key",
+                                       backoff_base=0, backoff_jitter=0)
+
+
+def test_retry_safe_file_close_is_noop(tmp_path):
+    image = tmp_path / "receipt.jpg"
+    image.write_bytes(b"x" * 16)
+
+    with open(image, 'rb') as f:
+        wrapper = _RetrySafeFile(f)
+        wrapper.close()
+        assert not f.closed
+        assert wrapper.read() == b"x" * 16
+
+
+def test_direct_file_upload_retries_after_transient_error(tmp_path):
+    image = tmp_path / "receipt.jpg"
+    image.write_bytes(b"x" * 16)
+
+    client = _make_client()
+    session = ClosingSession([503, 200])
+
+    with open(image, 'rb') as f:
+        result = asyncio.run(client._send_request(
+            session, data=f, headers={'Content-Type': 'image/jpeg'}))
+        # The handle must survive the first attempt's payload teardown
+        assert not f.closed
+
+    assert result == {"merchant_name": "A"}
+    assert len(session.bodies) == 2
+
+
+def test_multipart_file_upload_retries_after_transient_error(tmp_path):
+    image = tmp_path / "receipt.jpg"
+    image.write_bytes(b"x" * 16)
+
+    client = _make_client()
+    session = ClosingSession([429, 200])
+
+    with open(image, 'rb') as f:
+        files = {'image': (image.name, f, 'image/jpeg')}
+        result = asyncio.run(client._send_request(session, files=files))
+        assert not f.closed
+
+    assert result == {"merchant_name": "A"}
+    assert len(session.bodies) == 2